@@ -26,6 +26,7 @@ DROP TABLE IF EXISTS supervisors CASCADE;
 DROP TABLE IF EXISTS audit_log CASCADE;
 
 -- Drop views
+DROP MATERIALIZED VIEW IF EXISTS supervisor_employee_counts CASCADE;
 DROP VIEW IF EXISTS dashboard_stats CASCADE;
 DROP VIEW IF EXISTS vacation_request_summary CASCADE;
 
@@ -33,6 +34,7 @@ DROP VIEW IF EXISTS vacation_request_summary CASCADE;
 DROP FUNCTION IF EXISTS check_area_capacity CASCADE;
 DROP FUNCTION IF EXISTS check_vacation_conflicts CASCADE;
 DROP FUNCTION IF EXISTS archive_previous_legal_document CASCADE;
+DROP FUNCTION IF EXISTS refresh_supervisor_employee_counts CASCADE;
 DROP FUNCTION IF EXISTS update_updated_at_column CASCADE;
 
 -- =====================================================
@@ -157,6 +159,17 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Function to refresh the per-supervisor employee counts, called periodically by the application scheduler
+-- SECURITY DEFINER so the application role can refresh a view owned by the schema owner;
+-- the pinned search_path keeps callers from substituting their own objects
+-- CONCURRENTLY (using the unique index) lets readers keep using the old counts during the refresh
+CREATE OR REPLACE FUNCTION refresh_supervisor_employee_counts()
+RETURNS VOID AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY supervisor_employee_counts;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, pg_temp;
+
 -- =====================================================
 -- 3. CREATE BASE TABLES (no foreign key dependencies)
 -- =====================================================
@@ -424,7 +437,7 @@ CREATE TABLE notification_history (
 -- =====================================================
 
 -- Supervisors indexes
-CREATE INDEX idx_supervisors_firebase_uid ON supervisors(firebase_uid);
+-- Lookups by firebase_uid use the index behind the UNIQUE constraint on supervisors.firebase_uid
 CREATE INDEX idx_supervisors_email ON supervisors(email);
 CREATE INDEX idx_supervisors_department ON supervisors(department);
 
@@ -432,6 +445,8 @@ CREATE INDEX idx_supervisors_department ON supervisors(department);
 CREATE INDEX idx_employees_supervisor_id ON employees(supervisor_id);
 CREATE INDEX idx_employees_department ON employees(department);
 CREATE INDEX idx_employees_work_area ON employees(work_area_id, work_line_id);
+CREATE INDEX idx_employees_work_line ON employees(work_line_id);
+CREATE INDEX idx_employees_supervisor_dept_shift ON employees(supervisor_id, department, shift);
 
 -- Vacation requests indexes
 CREATE INDEX idx_vacation_requests_employee_id ON vacation_requests(employee_id);
@@ -447,6 +462,8 @@ CREATE INDEX idx_area_limits_work_area ON area_limits(work_area_id, work_line_id
 -- Feedback indexes
 CREATE INDEX idx_feedback_user_id ON feedback(user_id);
 CREATE INDEX idx_feedback_category ON feedback(category);
+CREATE INDEX idx_feedback_created_at ON feedback(created_at DESC, id DESC);
+CREATE INDEX idx_feedback_category_created_at ON feedback(category, created_at DESC, id DESC);
 
 -- Profile changes indexes
 CREATE INDEX idx_profile_changes_user_id ON profile_changes(user_id);
@@ -460,28 +477,31 @@ CREATE INDEX idx_faq_articles_published ON faq_articles(is_published);
 CREATE INDEX idx_support_tickets_user_id ON support_tickets(user_id);
 CREATE INDEX idx_support_tickets_status ON support_tickets(status);
 CREATE INDEX idx_support_tickets_priority ON support_tickets(priority);
+CREATE INDEX idx_support_tickets_created_at ON support_tickets(created_at DESC, id DESC);
+CREATE INDEX idx_support_tickets_status_priority_created_at ON support_tickets(status, priority, created_at DESC, id DESC);
 
 -- Article ratings indexes
 CREATE INDEX idx_article_ratings_article_id ON article_ratings(article_id);
 CREATE INDEX idx_article_ratings_user_id ON article_ratings(user_id);
 
 -- Admin emails indexes
-CREATE INDEX idx_admin_emails_email ON admin_emails(email);
+-- Lookups by email use the index behind the UNIQUE constraint on admin_emails.email
 CREATE INDEX idx_admin_emails_active ON admin_emails(is_active);
-CREATE INDEX idx_admin_emails_password_hash ON admin_emails(password_hash);
+CREATE INDEX idx_admin_emails_active_created_at ON admin_emails(created_at DESC) WHERE is_active;
 
 -- Legal documents indexes
 CREATE INDEX idx_legal_documents_type ON legal_documents(document_type);
 CREATE INDEX idx_legal_documents_active ON legal_documents(is_active);
 CREATE INDEX idx_legal_documents_effective_date ON legal_documents(effective_date);
+CREATE INDEX idx_legal_documents_type_active_version ON legal_documents(document_type, version DESC) WHERE is_active;
 CREATE INDEX idx_legal_document_history_document_id ON legal_document_history(document_id);
 CREATE INDEX idx_legal_document_history_type ON legal_document_history(document_type);
 
 -- Notification preferences indexes
-CREATE INDEX idx_notification_preferences_supervisor_id ON notification_preferences(supervisor_id);
+-- Lookups by supervisor_id use the index behind the UNIQUE constraint on notification_preferences.supervisor_id
 
 -- Notification history indexes
-CREATE INDEX idx_notification_history_supervisor_id ON notification_history(supervisor_id);
+CREATE INDEX idx_notification_history_supervisor_created_at ON notification_history(supervisor_id, created_at DESC);
 CREATE INDEX idx_notification_history_vacation_request_id ON notification_history(vacation_request_id);
 CREATE INDEX idx_notification_history_status ON notification_history(status);
 CREATE INDEX idx_notification_history_sent_at ON notification_history(sent_at);
@@ -578,6 +598,17 @@ LEFT JOIN employees e ON s.id = e.supervisor_id
 LEFT JOIN vacation_requests vr ON e.id = vr.employee_id
 GROUP BY s.id, s.department, s.shift;
 
+-- Create a materialized view for employee counts per supervisor (refreshed periodically by the application)
+CREATE MATERIALIZED VIEW supervisor_employee_counts AS
+SELECT
+    s.id AS supervisor_id,
+    COUNT(e.id) AS employee_count
+FROM supervisors s
+LEFT JOIN employees e ON s.id = e.supervisor_id
+GROUP BY s.id;
+
+CREATE UNIQUE INDEX idx_supervisor_employee_counts_supervisor_id ON supervisor_employee_counts(supervisor_id);
+
 -- =====================================================
 -- 8. INSERT SAMPLE DATA (after all structures are created)
 -- =====================================================
@@ -751,6 +782,7 @@ GRANT ALL PRIVILEGES ON SEQUENCE notification_history_id_seq TO vacation_user;
 -- Grant permissions to views
 GRANT SELECT ON vacation_request_summary TO vacation_user;
 GRANT SELECT ON dashboard_stats TO vacation_user;
+GRANT SELECT ON supervisor_employee_counts TO vacation_user;
 
 -- =====================================================
 -- 10. TABLE COMMENTS (for documentation)
@@ -0,0 +1,16 @@
+"""Gunicorn configuration for Don Miguel Vacation Manager"""
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+# Threaded workers: request handlers spend most of their time waiting on Postgres,
+# bcrypt and outbound HTTPS (Firebase, Twilio), all of which release the GIL, so a
+# single worker can keep many requests in flight at once
+worker_class = 'gthread'
+# backend/app.py starts the SMS notification scheduler in every worker process, so more
+# than one worker sends duplicate notifications; scale with threads instead
+workers = int(os.environ.get('GUNICORN_WORKERS', 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 16))
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+keepalive = 5